@@ -1,10 +1,10 @@
 import heapq
 import logging
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Literal, NamedTuple, Optional, overload
+from typing import TYPE_CHECKING, Any, Final, Literal, NamedTuple, Optional, overload
 
 from rotkehlchen.accounting.types import MissingAcquisition, MissingPrice
 from rotkehlchen.assets.asset import Asset
@@ -27,8 +27,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+# tax status of a matched acquisition shown in the spend cost basis debug logs
+TAX_FREE_STATUS: Final = 'TAX-FREE'
+TAXABLE_STATUS: Final = 'TAXABLE'
 
-@dataclass(init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False)
+
+@dataclass(init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False, slots=True)
 class AssetAcquisitionEvent:
     amount: FVal
     remaining_amount: FVal = field(init=False)  # Same as amount but reduced during processing
@@ -111,7 +115,7 @@ class AssetAcquisitionHeapElement(NamedTuple):
 
     Note:`heapq` uses a min heap implementation i.e. the smallest item comes out first.
 
-    For FIFO, a counter is used as the priority so the first acquisition comes out first.
+    FIFO does not need a heap since acquisitions are consumed in insertion order.
     For LIFO, a counter is used but negated, so the acquisition added last comes first.
     For HIFO, the amount of the acquisition is used although negated so the
     acquisition with the highest amount comes first.
@@ -125,8 +129,6 @@ class AssetAcquisitionHeapElement(NamedTuple):
 
 class BaseCostBasisMethod(ABC):
     """The base class in which every other cost basis method inherits from."""
-    def __init__(self) -> None:
-        self._acquisitions_heap: list[AssetAcquisitionHeapElement] = []
 
     @abstractmethod
     def add_in_event(self, acquisition: AssetAcquisitionEvent) -> None:
@@ -136,35 +138,126 @@ class BaseCostBasisMethod(ABC):
         and thus determines the PnL order.
         """
 
+    @abstractmethod
+    def _first_acquisition(self) -> AssetAcquisitionEvent:
+        """Returns the acquisition that should be consumed next.
+
+        May raise:
+        - IndexError if there are no acquisitions
+        """
+
+    @abstractmethod
+    def _remove_first_acquisition(self) -> None:
+        """Removes the acquisition returned by `_first_acquisition`"""
+
+    @abstractmethod
+    def get_acquisitions(self) -> tuple[AssetAcquisitionEvent, ...]:
+        """Returns read-only _acquisitions"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Returns the number of acquisitions that still have a remaining amount"""
+
     def processing_iterator(self) -> Iterator[AssetAcquisitionEvent]:
         """
         Iteration method over acquisition events.
         We can't return here Tuple of AssetAcquisitionEvents as we need to return
         the first event each time but _acquisitions may be not modified between iterations.
         """
-        while len(self._acquisitions_heap) > 0:
-            yield self._acquisitions_heap[0].acquisition_event
-
-    def get_acquisitions(self) -> tuple[AssetAcquisitionEvent, ...]:
-        """Returns read-only _acquisitions"""
-        return tuple(entry.acquisition_event for entry in self._acquisitions_heap)
+        while len(self) > 0:
+            yield self._first_acquisition()
 
-    def consume_result(self, used_amount: FVal, asset: Asset) -> None:
+    def consume_result(
+            self,
+            used_amount: FVal,
+            asset: Asset,  # pylint: disable=unused-argument
+    ) -> None:
         """
         This function should be used to consume results of the
         currently processed event (received from __next__)
         The current event's remaining_amount will be decreased by used_amount
         If event's remaining_amount will become ZERO, the event will be deleted
+
+        `used_amount` has to be in the interval [0, remaining_amount] of the current
+        event. This is guaranteed by the callers and is not re-checked here since
+        this runs once per consumed acquisition.
+
         May raise:
         - IndexError if the method was called when acquisitions were empty
         """
-        # this is a temporary assertion to test that new accounting tools work properly.
-        # Written on 06.06.2022 and can be removed after a couple of months if everything goes well
-        assert ZERO <= used_amount <= self._acquisitions_heap[0].acquisition_event.remaining_amount, f'Used amount must be in the interval [0, {self._acquisitions_heap[0].acquisition_event.remaining_amount}] but it was {used_amount} for {asset}'  # noqa: E501
+        acquisition_event = self._first_acquisition()
+        acquisition_event.remaining_amount -= used_amount
+        if acquisition_event.remaining_amount.is_zero():
+            self._remove_first_acquisition()
 
-        self._acquisitions_heap[0].acquisition_event.remaining_amount -= used_amount
-        if self._acquisitions_heap[0].acquisition_event.remaining_amount == ZERO:
-            heapq.heappop(self._acquisitions_heap)
+    def consume_acquisitions(
+            self,
+            amount: FVal,
+            asset: Asset,
+    ) -> list[tuple[AssetAcquisitionEvent, FVal]]:
+        """
+        Consumes acquisitions in the order of the cost basis method until `amount` is
+        covered or there are no more acquisitions. This is the common part of spending
+        and of simply reducing the amount of an asset.
+
+        Returns each consumed acquisition along with the amount used from it. An
+        acquisition was used up entirely if its remaining_amount is zero.
+        The sum of the used amounts is less than `amount` if acquisitions ran out.
+        """
+        consumed = []
+        remaining_amount = amount
+        for acquisition_event in self.processing_iterator():
+            acquisition_remaining_amount = acquisition_event.remaining_amount
+            if remaining_amount < acquisition_remaining_amount:
+                self.consume_result(used_amount=remaining_amount, asset=asset)
+                consumed.append((acquisition_event, remaining_amount))
+                # stop iterating since we found all acquisitions to satisfy the amount
+                break
+
+            self.consume_result(used_amount=acquisition_remaining_amount, asset=asset)
+            consumed.append((acquisition_event, acquisition_remaining_amount))
+            remaining_amount -= acquisition_remaining_amount
+
+        return consumed
+
+    @staticmethod
+    def _match_acquisition(
+            acquisition_event: AssetAcquisitionEvent,
+            used_amount: FVal,
+            spending_asset: Asset,
+            taxfree_cutoff: int | None,
+            average_cost_basis: FVal | None,
+            settings: DBSettings,
+            timestamp_to_date: Callable[[Timestamp], str],
+            debug_enabled: bool,
+    ) -> tuple['MatchedAcquisition', FVal]:
+        """
+        Matches `used_amount` of an already consumed acquisition to a spend and decides
+        if it is taxable or past the taxfree period.
+
+        Returns the matched acquisition and the cost of the used amount.
+        """
+        acquisition_rate = acquisition_event.rate if average_cost_basis is None else average_cost_basis  # noqa: E501
+        at_taxfree_period = taxfree_cutoff is not None and acquisition_event.timestamp < taxfree_cutoff  # noqa: E501
+        if debug_enabled:
+            fully_used = acquisition_event.remaining_amount.is_zero()
+            log.debug(
+                f'Spend uses up {"entire" if fully_used else "part of"} historical acquisition',
+                tax_status=TAX_FREE_STATUS if at_taxfree_period else TAXABLE_STATUS,
+                used_amount=used_amount,
+                from_amount=acquisition_event.amount,
+                asset=spending_asset,
+                acquisition_rate=acquisition_event.rate,
+                profit_currency=settings.main_currency,
+                time=timestamp_to_date(acquisition_event.timestamp),
+            )
+
+        matched_acquisition = MatchedAcquisition(
+            amount=used_amount,
+            event=acquisition_event,
+            taxable=not at_taxfree_period,
+        )
+        return matched_acquisition, acquisition_rate * used_amount
 
     def calculate_spend_cost_basis(
             self,
@@ -188,85 +281,66 @@ class BaseCostBasisMethod(ABC):
         Returns the information in a CostBasisInfo object if enough acquisitions have
         been found.
         """  # noqa: E501
-        remaining_sold_amount = spending_amount
+        # acquisitions made before the cutoff are past the taxfree period at the spend's time
+        taxfree_period = settings.taxfree_after_period
+        taxfree_cutoff = None if taxfree_period is None else timestamp - taxfree_period
+        # avoid formatting dates and building the log kwargs per acquisition if not logged
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        if len(self) != 0:
+            acquisition_event = self._first_acquisition()
+            if acquisition_event.remaining_amount > spending_amount:
+                # Fast path for the most common case where the first acquisition alone can
+                # satisfy the spend. Does the same as a single partial consumption below
+                self.consume_result(used_amount=spending_amount, asset=spending_asset)
+                matched_acquisition, acquisition_cost = self._match_acquisition(
+                    acquisition_event=acquisition_event,
+                    used_amount=spending_amount,
+                    spending_asset=spending_asset,
+                    taxfree_cutoff=taxfree_cutoff,
+                    average_cost_basis=average_cost_basis,
+                    settings=settings,
+                    timestamp_to_date=timestamp_to_date,
+                    debug_enabled=debug_enabled,
+                )
+                taxable = matched_acquisition.taxable
+                return CostBasisInfo(
+                    taxable_amount=spending_amount if taxable else ZERO,
+                    taxable_bought_cost=acquisition_cost if taxable else ZERO,
+                    taxfree_bought_cost=ZERO if taxable else acquisition_cost,
+                    matched_acquisitions=[matched_acquisition],
+                    is_complete=True,
+                )
+
+        # only allocated here since the fast path above does not need them
         taxfree_bought_cost = taxable_bought_cost = taxable_amount = taxfree_amount = ZERO
         matched_acquisitions = []
-
-        for acquisition_event in self.processing_iterator():
-            if settings.taxfree_after_period is None:
-                at_taxfree_period = False
+        consumed = self.consume_acquisitions(amount=spending_amount, asset=spending_asset)
+        for acquisition_event, used_amount in consumed:
+            matched_acquisition, acquisition_cost = self._match_acquisition(
+                acquisition_event=acquisition_event,
+                used_amount=used_amount,
+                spending_asset=spending_asset,
+                taxfree_cutoff=taxfree_cutoff,
+                average_cost_basis=average_cost_basis,
+                settings=settings,
+                timestamp_to_date=timestamp_to_date,
+                debug_enabled=debug_enabled,
+            )
+            if matched_acquisition.taxable:
+                taxable_amount += used_amount
+                taxable_bought_cost += acquisition_cost
             else:
-                at_taxfree_period = acquisition_event.timestamp + settings.taxfree_after_period < timestamp  # noqa: E501
-
-            if remaining_sold_amount < acquisition_event.remaining_amount:
-                acquisition_rate = acquisition_event.rate if average_cost_basis is None else average_cost_basis  # noqa: E501
-                acquisition_cost = acquisition_rate * remaining_sold_amount
-
-                taxable = True
-                if at_taxfree_period:
-                    taxfree_amount += remaining_sold_amount
-                    taxfree_bought_cost += acquisition_cost
-                    taxable = False
-                else:
-                    taxable_amount += remaining_sold_amount
-                    taxable_bought_cost += acquisition_cost
-
-                log.debug(
-                    'Spend uses up part of historical acquisition',
-                    tax_status='TAX-FREE' if at_taxfree_period else 'TAXABLE',
-                    used_amount=remaining_sold_amount,
-                    from_amount=acquisition_event.amount,
-                    asset=spending_asset,
-                    acquisition_rate=acquisition_event.rate,
-                    profit_currency=settings.main_currency,
-                    time=timestamp_to_date(acquisition_event.timestamp),
-                )
-                matched_acquisitions.append(MatchedAcquisition(
-                    amount=remaining_sold_amount,
-                    event=acquisition_event,
-                    taxable=taxable,
-                ))
-                self.consume_result(used_amount=remaining_sold_amount, asset=spending_asset)
-                remaining_sold_amount = ZERO
-                # stop iterating since we found all acquisitions to satisfy this spend
-                break
-
-            remaining_sold_amount -= acquisition_event.remaining_amount
-            acquisition_rate = acquisition_event.rate if average_cost_basis is None else average_cost_basis  # noqa: E501
-            acquisition_cost = acquisition_rate * acquisition_event.remaining_amount
-            taxable = True
-            if at_taxfree_period:
-                taxfree_amount += acquisition_event.remaining_amount
+                taxfree_amount += used_amount
                 taxfree_bought_cost += acquisition_cost
-                taxable = False
-            else:
-                taxable_amount += acquisition_event.remaining_amount
-                taxable_bought_cost += acquisition_cost
 
-            log.debug(
-                'Spend uses up entire historical acquisition',
-                tax_status='TAX-FREE' if at_taxfree_period else 'TAXABLE',
-                bought_amount=acquisition_event.remaining_amount,
-                asset=spending_asset,
-                acquisition_rate=acquisition_event.rate,
-                profit_currency=settings.main_currency,
-                time=timestamp_to_date(acquisition_event.timestamp),
-            )
-            matched_acquisitions.append(MatchedAcquisition(
-                amount=acquisition_event.remaining_amount,
-                event=acquisition_event,
-                taxable=taxable,
-            ))
-            used_acquisitions.append(acquisition_event)
-            self.consume_result(
-                used_amount=acquisition_event.remaining_amount,
-                asset=spending_asset,
-            )
-            # and since this event is going to be removed, reduce its remaining to zero
-            acquisition_event.remaining_amount = ZERO
+            matched_acquisitions.append(matched_acquisition)
+            if acquisition_event.remaining_amount.is_zero():
+                used_acquisitions.append(acquisition_event)
 
+        remaining_sold_amount = spending_amount - taxable_amount - taxfree_amount
         is_complete = True
-        if remaining_sold_amount != ZERO:
+        if not remaining_sold_amount.is_zero():
             # if we still have sold amount but no acquisitions to satisfy it then we only
             # found acquisitions to partially satisfy the sell
             adjusted_amount = spending_amount - taxfree_amount
@@ -289,26 +363,57 @@ class BaseCostBasisMethod(ABC):
             is_complete=is_complete,
         )
 
+
+class HeapCostBasisMethod(BaseCostBasisMethod):
+    """Base class for the cost basis methods that keep their acquisitions in a priority heap"""
+    def __init__(self) -> None:
+        self._acquisitions_heap: list[AssetAcquisitionHeapElement] = []
+
+    def _first_acquisition(self) -> AssetAcquisitionEvent:
+        return self._acquisitions_heap[0].acquisition_event
+
+    def _remove_first_acquisition(self) -> None:
+        heapq.heappop(self._acquisitions_heap)
+
+    def get_acquisitions(self) -> tuple[AssetAcquisitionEvent, ...]:
+        return tuple(entry.acquisition_event for entry in self._acquisitions_heap)
+
     def __len__(self) -> int:
         return len(self._acquisitions_heap)
 
 
-class FIFOCostBasisMethod(BaseCostBasisMethod):
+class DequeCostBasisMethod(BaseCostBasisMethod):
     """
-    Accounting in FIFO (first-in-first-out) method.
-    https://www.investopedia.com/terms/f/fifo.asp
+    Base class for the cost basis methods that consume their acquisitions in insertion
+    order. They are kept in a deque which gives O(1) appends and pops of the first acquisition.
     """
     def __init__(self) -> None:
-        super().__init__()
-        self._count = ZERO
+        self._acquisitions: deque[AssetAcquisitionEvent] = deque()
+
+    def _first_acquisition(self) -> AssetAcquisitionEvent:
+        return self._acquisitions[0]
+
+    def _remove_first_acquisition(self) -> None:
+        self._acquisitions.popleft()
 
+    def get_acquisitions(self) -> tuple[AssetAcquisitionEvent, ...]:
+        return tuple(self._acquisitions)
+
+    def __len__(self) -> int:
+        return len(self._acquisitions)
+
+
+class FIFOCostBasisMethod(DequeCostBasisMethod):
+    """
+    Accounting in FIFO (first-in-first-out) method.
+    https://www.investopedia.com/terms/f/fifo.asp
+    """
     def add_in_event(self, acquisition: AssetAcquisitionEvent) -> None:
-        """Adds an acquisition to the `_acquisitions_heap` using a counter to achieve the FIFO order."""  # noqa: E501
-        heapq.heappush(self._acquisitions_heap, AssetAcquisitionHeapElement(self._count, acquisition))  # noqa: E501
-        self._count += 1
+        """Appends an acquisition to the end of `_acquisitions` to achieve the FIFO order."""
+        self._acquisitions.append(acquisition)
 
 
-class LIFOCostBasisMethod(BaseCostBasisMethod):
+class LIFOCostBasisMethod(HeapCostBasisMethod):
     """
     Accounting in LIFO (last-in-first-out) method.
     https://www.investopedia.com/terms/l/lifo.asp
@@ -323,7 +428,7 @@ class LIFOCostBasisMethod(BaseCostBasisMethod):
         self._count += 1
 
 
-class HIFOCostBasisMethod(BaseCostBasisMethod):
+class HIFOCostBasisMethod(HeapCostBasisMethod):
     """
     Accounting in HIFO (highest-in-first-out) method.
     https://www.investopedia.com/terms/h/hifo.asp
@@ -336,7 +441,7 @@ class HIFOCostBasisMethod(BaseCostBasisMethod):
         heapq.heappush(self._acquisitions_heap, AssetAcquisitionHeapElement(-acquisition.rate, acquisition))  # noqa: E501
 
 
-class AverageCostBasisMethod(BaseCostBasisMethod):
+class AverageCostBasisMethod(DequeCostBasisMethod):
     """
     Accounting in Average Cost Basis(ACB) method.
 
@@ -352,7 +457,6 @@ class AverageCostBasisMethod(BaseCostBasisMethod):
     """  # noqa: E501
     def __init__(self) -> None:
         super().__init__()
-        self._count = ZERO
         # keeps track of the amount of the asset remaining after every acquisition or spend
         self.current_amount = ZERO
         # the current total cost basis of the asset
@@ -360,7 +464,7 @@ class AverageCostBasisMethod(BaseCostBasisMethod):
 
     def add_in_event(self, acquisition: AssetAcquisitionEvent) -> None:
         """
-        Adds an acquisition to the `_acquisitions_heap` in order of time seen.
+        Adds an acquisition to the `_acquisitions` in order of time seen.
 
         It also calculates the average cost basis of that acquisition with respect to the
         previous average cost basis.
@@ -368,13 +472,9 @@ class AverageCostBasisMethod(BaseCostBasisMethod):
         The formula used to calculate the average cost basis of an acquisition is:
         [Previous Total ACB] + [Cost of New Shares] + [Transaction Costs]
         """
-        heapq.heappush(
-            self._acquisitions_heap,
-            AssetAcquisitionHeapElement(self._count, acquisition),
-        )
+        self._acquisitions.append(acquisition)
         self.current_total_acb += acquisition.amount * acquisition.rate
         self.current_amount += acquisition.amount
-        self._count += 1
 
     def consume_result(self, used_amount: FVal, asset: Asset) -> None:
         """
@@ -382,11 +482,11 @@ class AverageCostBasisMethod(BaseCostBasisMethod):
         `current_amount` is guaranteed to be greater than zero since `consume_result` is
         supposed to be called under `processing_iterator`.
         """
-        if self.current_amount == ZERO:
+        if self.current_amount.is_zero():
             # this shouldn't happen but a user reported it in
             # https://github.com/rotki/rotki/issues/7273. We couldn't find the reason for it so we
             # decided to protect against it by raising an error shown in the frontend
-            log.error(f'Division by zero error when processing report using ACB. {self._acquisitions_heap}')  # noqa: E501
+            log.error(f'Division by zero error when processing report using ACB. {self._acquisitions}')  # noqa: E501
             raise AccountingError(
                 f'Remaining amount error during ACB calculation for {asset}. Contact support and '
                 'provide the log file for more information',
@@ -408,7 +508,7 @@ class AverageCostBasisMethod(BaseCostBasisMethod):
             average_cost_basis: FVal | None = None,  # pylint: disable=unused-argument
     ) -> 'CostBasisInfo':
         """Calculates the cost basis of the spend using the average cost basis method."""
-        if self.current_amount == ZERO:
+        if self.current_amount.is_zero():
             missing_acquisitions.append(
                 MissingAcquisition(
                     asset=spending_asset,
@@ -457,7 +557,8 @@ class CostBasisEvents:
         self.used_acquisitions: list[AssetAcquisitionEvent] = []
 
 
-class MatchedAcquisition(NamedTuple):
+@dataclass(init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False, slots=True)
+class MatchedAcquisition:
     amount: FVal  # the amount used from the acquisition event
     event: AssetAcquisitionEvent  # the acquisition event
     taxable: bool  # whether it counts for taxable or non-taxable cost basis
@@ -545,27 +646,16 @@ class CostBasisInfo(NamedTuple):
         """
         Turn to 2 strings to be shown in exported files such as CSV for taxable and free cost basis
         """
-        taxable = ''
-        free = ''
+        taxable: list[str] = []
+        free: list[str] = []
         if not self.is_complete:
-            taxable += 'Incomplete cost basis information for spend.'
-            free += 'Incomplete cost basis information for spend.'
-
-        if len(self.matched_acquisitions) == 0:
-            return taxable, free
+            taxable.append('Incomplete cost basis information for spend.')
+            free.append('Incomplete cost basis information for spend.')
 
         for entry in self.matched_acquisitions:
-            stringified = entry.to_string(converter)
-            if entry.taxable:
-                if taxable != '':
-                    taxable += ' '
-                taxable += stringified
-            else:
-                if free != '':
-                    free += ' '
-                free += stringified
+            (taxable if entry.taxable else free).append(entry.to_string(converter))
 
-        return taxable, free
+        return ' '.join(taxable), ' '.join(free)
 
 
 class CostBasisCalculator(CustomizableDateMixin):
@@ -585,6 +675,15 @@ class CostBasisCalculator(CustomizableDateMixin):
         self._events: defaultdict[Asset, CostBasisEvents] = defaultdict(lambda: CostBasisEvents(settings.cost_basis_method))  # noqa: E501
         self.missing_acquisitions: list[MissingAcquisition] = []
         self.missing_prices: set[MissingPrice] = set()
+        # the same acquisition timestamps get formatted again and again during a run
+        self._timestamp_to_date_cache: dict[Timestamp, str] = {}
+
+    def _cached_timestamp_to_date(self, timestamp: Timestamp) -> str:
+        """Same as timestamp_to_date but memoized for the duration of an accounting run"""
+        if (date := self._timestamp_to_date_cache.get(timestamp)) is None:
+            date = self.timestamp_to_date(timestamp)
+            self._timestamp_to_date_cache[timestamp] = date
+        return date
 
     def get_events(self, asset: Asset) -> CostBasisEvents:
         """Custom getter for events so that we have common cost basis for some assets"""
@@ -602,28 +701,31 @@ class CostBasisCalculator(CustomizableDateMixin):
         This function does the same as calculate_spend_cost_basis as far as consuming
         acquisitions is concerned but does not calculate bought cost.
         """
-        asset_events = self.get_events(asset)
+        return self._reduce_asset_amount(
+            asset_events=self.get_events(asset),
+            asset=asset,
+            amount=amount,
+            timestamp=timestamp,
+        )
+
+    def _reduce_asset_amount(
+            self,
+            asset_events: CostBasisEvents,
+            asset: Asset,
+            amount: FVal,
+            timestamp: Timestamp,
+    ) -> bool:
+        """Same as reduce_asset_amount but for callers that already got the asset's events"""
         if len(asset_events.acquisitions_manager) == 0:
             return False
 
         remaining_amount = amount
-        for acquisition_event in asset_events.acquisitions_manager.processing_iterator():
-            if remaining_amount < acquisition_event.remaining_amount:
-                asset_events.acquisitions_manager.consume_result(
-                    used_amount=remaining_amount,
-                    asset=asset,
-                )
-                remaining_amount = ZERO
-                # stop iterating since we found all acquisitions to satisfy reduction
-                break
-
-            remaining_amount -= acquisition_event.remaining_amount
-            asset_events.acquisitions_manager.consume_result(
-                used_amount=acquisition_event.remaining_amount,
-                asset=asset,
-            )
+        acquisitions_manager = asset_events.acquisitions_manager
+        consumed = acquisitions_manager.consume_acquisitions(amount=amount, asset=asset)
+        for _, used_amount in consumed:
+            remaining_amount -= used_amount
 
-        if remaining_amount != ZERO:
+        if not remaining_amount.is_zero():
             if not asset.is_fiat():
                 self.missing_acquisitions.append(
                     MissingAcquisition(
@@ -707,7 +809,7 @@ class CostBasisCalculator(CustomizableDateMixin):
         )
         asset_events = self.get_events(asset)
         asset_events.spends.append(event)
-        if not asset.is_fiat() and taxable_spend:
+        if taxable_spend and not asset.is_fiat():
             return asset_events.acquisitions_manager.calculate_spend_cost_basis(
                 spending_amount=amount,
                 spending_asset=asset,
@@ -715,10 +817,15 @@ class CostBasisCalculator(CustomizableDateMixin):
                 missing_acquisitions=self.missing_acquisitions,
                 used_acquisitions=asset_events.used_acquisitions,
                 settings=self.settings,
-                timestamp_to_date=self.timestamp_to_date,
+                timestamp_to_date=self._cached_timestamp_to_date,
             )
         # just reduce the amount's acquisition without counting anything
-        self.reduce_asset_amount(asset=asset, amount=amount, timestamp=timestamp)
+        self._reduce_asset_amount(
+            asset_events=asset_events,
+            asset=asset,
+            amount=amount,
+            timestamp=timestamp,
+        )
         return None
 
     def get_calculated_asset_amount(self, asset: Asset) -> FVal | None:
@@ -726,8 +833,5 @@ class CostBasisCalculator(CustomizableDateMixin):
         the history has been processed
         """
         asset_events = self.get_events(asset)
-
-        amount = ZERO
-        for acquisition_event in asset_events.acquisitions_manager.get_acquisitions():
-            amount += acquisition_event.remaining_amount
-        return amount if amount != ZERO else None
+        amount = sum((x.remaining_amount for x in asset_events.acquisitions_manager.get_acquisitions()), ZERO)  # noqa: E501
+        return amount if not amount.is_zero() else None
@@ -12,6 +12,27 @@ from rotkehlchen.types import Location, Price, Timestamp
 if TYPE_CHECKING:
     from .base import CostBasisCalculator
 
+# Lowercased asset identifier -> (fork timestamp, (forked asset, notes) pairs) for the
+# forked assets that are also acquired when the asset is acquired before the fork.
+# Keyed by lowercased identifier since asset equality is case insensitive.
+PREFORK_ACQUISITIONS: dict[str, tuple[int, tuple[tuple[Asset, str], ...]]] = {
+    A_ETH.identifier.lower(): (ETH_DAO_FORK_TS, ((A_ETC, 'Prefork acquisition for ETC'),)),
+    # Acquiring BTC before the BCH fork provides equal amount of BCH and BSV
+    A_BTC.identifier.lower(): (BTC_BCH_FORK_TS, (
+        (A_BCH, 'Prefork acquisition for BCH'),
+        (A_BSV, 'Prefork acquisition for BSV'),
+    )),
+    # Acquiring BCH before the BSV fork provides equal amount of BSV
+    A_BCH.identifier.lower(): (BCH_BSV_FORK_TS, ((A_BSV, 'Prefork acquisition for BSV'),)),
+}
+# Lowercased asset identifier -> (fork timestamp, forked assets) for the forked assets
+# whose amount is also reduced when the asset is spent before the fork
+PREFORK_SPENDS: dict[str, tuple[int, tuple[Asset, ...]]] = {
+    A_ETH.identifier.lower(): (ETH_DAO_FORK_TS, (A_ETC,)),
+    A_BTC.identifier.lower(): (BTC_BCH_FORK_TS, (A_BCH, A_BSV)),
+    A_BCH.identifier.lower(): (BCH_BSV_FORK_TS, (A_BSV,)),
+}
+
 
 def handle_prefork_asset_acquisitions(
         cost_basis: 'CostBasisCalculator',
@@ -31,21 +52,12 @@ def handle_prefork_asset_acquisitions(
 
         Returns the acquisition events to append to the pot
     """
-    acquisitions = []
-    if asset == A_ETH and timestamp < ETH_DAO_FORK_TS:
-        acquisitions = [(A_ETC, 'Prefork acquisition for ETC')]
-    elif asset == A_BTC and timestamp < BTC_BCH_FORK_TS:
-        # Acquiring BTC before the BCH fork provides equal amount of BCH and BSV
-        acquisitions = [
-            (A_BCH, 'Prefork acquisition for BCH'),
-            (A_BSV, 'Prefork acquisition for BSV'),
-        ]
-    elif asset == A_BCH and timestamp < BCH_BSV_FORK_TS:
-        # Acquiring BCH before the BSV fork provides equal amount of BSV
-        acquisitions = [(A_BSV, 'Prefork acquisition for BSV')]
+    fork_info = PREFORK_ACQUISITIONS.get(asset.identifier.lower())
+    if fork_info is None or timestamp >= fork_info[0]:
+        return []
 
     events = []
-    for acquisition in acquisitions:
+    for acquisition in fork_info[1]:
         if acquisition[0].identifier in ignored_asset_ids:
             continue
         event = ProcessedAccountingEvent(
@@ -83,12 +95,9 @@ def handle_prefork_asset_spends(
     # For now for those don't use inform_user_missing_acquisition since if those hit
     # the preforked asset acquisition data is what's missing so user would getLogger
     # two messages. So as an example one for missing ETH data and one for ETC data
-    if asset == A_ETH and timestamp < ETH_DAO_FORK_TS:
-        cost_basis.reduce_asset_amount(asset=A_ETC, amount=amount, timestamp=timestamp)
-
-    if asset == A_BTC and timestamp < BTC_BCH_FORK_TS:
-        cost_basis.reduce_asset_amount(asset=A_BCH, amount=amount, timestamp=timestamp)
-        cost_basis.reduce_asset_amount(asset=A_BSV, amount=amount, timestamp=timestamp)
+    fork_info = PREFORK_SPENDS.get(asset.identifier.lower())
+    if fork_info is None or timestamp >= fork_info[0]:
+        return
 
-    if asset == A_BCH and timestamp < BCH_BSV_FORK_TS:
-        cost_basis.reduce_asset_amount(asset=A_BSV, amount=amount, timestamp=timestamp)
+    for forked_asset in fork_info[1]:
+        cost_basis.reduce_asset_amount(asset=forked_asset, amount=amount, timestamp=timestamp)
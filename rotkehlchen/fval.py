@@ -11,6 +11,11 @@ AcceptableFValOtherInput = Union[int, 'FVal']
 DefaultContext.prec = ceil(log10(2 ** 256))  # support upto uint256 max value
 setcontext(DefaultContext)
 
+# Possible results of Decimal.compare_signal(). Created once since comparisons are hot
+_DECIMAL_GT = Decimal(1)
+_DECIMAL_EQ = Decimal(0)
+_DECIMAL_LT = Decimal(-1)
+
 
 class FVal:
     """A value to represent numbers for financial applications. At the moment
@@ -27,7 +32,11 @@ class FVal:
     def __init__(self, data: AcceptableFValInitInput = 0):
 
         try:
-            if isinstance(data, float):
+            if isinstance(data, Decimal):
+                # Checked first since every arithmetic operation creates an FVal from the
+                # resulting Decimal. Decimals are immutable so no need to copy it.
+                self.num = data
+            elif isinstance(data, float):
                 self.num = Decimal(str(data))
             elif isinstance(data, bytes):
                 # assume it's an ascii string and try to decode the bytes to one
@@ -36,7 +45,7 @@ class FVal:
                 # This elif has to come before the isinstance(int) check due to
                 # https://stackoverflow.com/questions/37888620/comparing-boolean-and-int-using-isinstance
                 raise ValueError('Invalid type bool for data given to FVal constructor')
-            elif isinstance(data, Decimal | int | str):
+            elif isinstance(data, int | str):
                 self.num = Decimal(data)
             elif isinstance(data, FVal):
                 self.num = data.num
@@ -60,19 +69,19 @@ class FVal:
 
     def __gt__(self, other: AcceptableFValOtherInput) -> bool:
         evaluated_other = _evaluate_input(other)
-        return self.num.compare_signal(evaluated_other) == Decimal(1)
+        return self.num.compare_signal(evaluated_other) == _DECIMAL_GT
 
     def __lt__(self, other: AcceptableFValOtherInput) -> bool:
         evaluated_other = _evaluate_input(other)
-        return self.num.compare_signal(evaluated_other) == Decimal(-1)
+        return self.num.compare_signal(evaluated_other) == _DECIMAL_LT
 
     def __le__(self, other: AcceptableFValOtherInput) -> bool:
         evaluated_other = _evaluate_input(other)
-        return self.num.compare_signal(evaluated_other) in (Decimal(-1), Decimal(0))
+        return self.num.compare_signal(evaluated_other) != _DECIMAL_GT
 
     def __ge__(self, other: AcceptableFValOtherInput) -> bool:
         evaluated_other = _evaluate_input(other)
-        return self.num.compare_signal(evaluated_other) in (Decimal(1), Decimal(0))
+        return self.num.compare_signal(evaluated_other) != _DECIMAL_LT
 
     def __eq__(self, other: object) -> bool:
         evaluated_other: Decimal | int
@@ -83,7 +92,7 @@ class FVal:
         else:
             evaluated_other = other
 
-        return self.num.compare_signal(evaluated_other) == Decimal(0)
+        return self.num.compare_signal(evaluated_other) == _DECIMAL_EQ
 
     def __add__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
@@ -177,6 +186,10 @@ class FVal:
             raise ConversionError(f'Tried to ask for exact int from {self.num}')
         return int(self.num)
 
+    def is_zero(self) -> bool:
+        """Cheaper than comparing against ZERO since it skips the comparison machinery"""
+        return self.num.is_zero()
+
     def is_close(self, other: AcceptableFValInitInput, max_diff: str = '1e-6') -> bool:
         evaluated_max_diff = FVal(max_diff)
 
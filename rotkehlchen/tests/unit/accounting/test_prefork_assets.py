@@ -1,7 +1,13 @@
 import pytest
 
+from rotkehlchen.accounting.accountant import Accountant
+from rotkehlchen.accounting.cost_basis.prefork import (
+    handle_prefork_asset_acquisitions,
+    handle_prefork_asset_spends,
+)
 from rotkehlchen.accounting.mixins.event import AccountingEventType
 from rotkehlchen.accounting.pnl import PNL, PnlTotals
+from rotkehlchen.assets.asset import Asset
 from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.assets import A_BCH, A_BSV, A_BTC, A_ETC, A_ETH, A_EUR
 from rotkehlchen.exchanges.data_structures import Trade
@@ -9,7 +15,7 @@ from rotkehlchen.fval import FVal
 from rotkehlchen.tests.utils.accounting import accounting_history_process, check_pnls_and_csv
 from rotkehlchen.tests.utils.history import prices
 from rotkehlchen.tests.utils.messages import no_message_errors
-from rotkehlchen.types import Location, TradeType
+from rotkehlchen.types import Location, Price, Timestamp, TradeType
 
 
 @pytest.mark.parametrize('mocked_price_queries', [prices])
@@ -268,3 +274,32 @@ def test_buying_selling_bch_before_bsvfork(accountant, google_service):
         AccountingEventType.FEE: PNL(taxable=FVal('-3.04'), free=ZERO),
     })
     check_pnls_and_csv(accountant, expected_pnls, google_service)
+
+
+def test_prefork_non_canonical_identifier(accountant: Accountant):
+    """Test that prefork handling matches assets case insensitively like asset equality"""
+    cost_basis = accountant.pots[0].cost_basis
+    btc = Asset(A_BTC.identifier.lower())
+    assert btc == A_BTC and btc.identifier != A_BTC.identifier
+    events = handle_prefork_asset_acquisitions(
+        cost_basis=cost_basis,
+        location=Location.EXTERNAL,
+        timestamp=Timestamp(1491593374),  # 04/07/2017
+        asset=btc,
+        amount=FVal(2),
+        price=Price(FVal('1128.905')),
+        ignored_asset_ids=set(),
+        starting_index=1,
+    )
+    assert [event.asset for event in events] == [A_BCH, A_BSV]
+    assert cost_basis.get_calculated_asset_amount(A_BCH) == FVal(2)
+    assert cost_basis.get_calculated_asset_amount(A_BSV) == FVal(2)
+
+    handle_prefork_asset_spends(
+        cost_basis=cost_basis,
+        asset=btc,
+        amount=FVal('0.5'),
+        timestamp=Timestamp(1500595200),  # 21/07/2017
+    )
+    assert cost_basis.get_calculated_asset_amount(A_BCH) == FVal('1.5')
+    assert cost_basis.get_calculated_asset_amount(A_BSV) == FVal('1.5')
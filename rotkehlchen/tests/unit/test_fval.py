@@ -103,6 +103,15 @@ def test_int_comparison():
     assert e == c
 
 
+def test_is_zero():
+    assert FVal(0).is_zero()
+    assert FVal('0.000').is_zero()
+    assert FVal('-0').is_zero()
+    assert (FVal('1.5') - FVal('1.50')).is_zero()
+    assert not FVal('0.000000000000000001').is_zero()
+    assert not FVal(-1).is_zero()
+
+
 def test_representation():
     a = FVal(2.01)
     b = FVal('2.01')